@@ -1,37 +1,293 @@
 import sqlite3
+import atexit
 import logging
 import os
-from datetime import datetime
-from typing import Optional, Dict, List
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, Iterator, List, Tuple
 
 logger = logging.getLogger("fraud-db")
 
+# Column definitions for the cases table, shared by the schema and its migrations
+_CASES_DDL_COLUMNS = """
+    customer_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE,
+    card_last4 TEXT NOT NULL,
+    security_question TEXT NOT NULL,
+    security_answer TEXT NOT NULL,
+    status_id INTEGER DEFAULT 0 REFERENCES statuses (id),
+    notes TEXT DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+"""
+
+# Case statuses seeded into the statuses lookup table; cases store the integer id.
+# Other status names are added to the table the first time they are used.
+_STATUS_NAMES = {0: 'pending', 1: 'in_review', 2: 'resolved'}
+
+# Per-connection tuning; journal_mode=WAL is persistent and set once at init
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    # Caps the rows ANALYZE scans per index, keeping PRAGMA optimize cheap
+    "PRAGMA analysis_limit=400",
+)
+
+# Maximum number of cases kept in the in-process read cache
+_CACHE_MAX = 256
+
+# Case columns returned by lookups; notes are loaded separately via get_case_notes
+_CASE_COLUMNS = "customer_id,name,card_last4,security_question,security_answer,status,created_at,updated_at"
+
+# Transaction columns appended to each case row by the case lookups
+_TX_COLUMNS = ("merchant", "amount", "location", "timestamp")
+
+# Case row joined with its latest transaction; the correlated subquery is a
+# single seek on idx_tx_customer rather than a scan of transactions
+_CASE_WITH_TX_SQL = """
+    SELECT c.customer_id, c.name, c.card_last4, c.security_question, c.security_answer,
+           c.status_id, c.created_at, c.updated_at,
+           t.merchant, t.amount, t.location, t.timestamp
+    FROM cases c
+    LEFT JOIN transactions t ON t.id = (
+        SELECT id FROM transactions
+        WHERE customer_id = c.customer_id
+        ORDER BY id DESC LIMIT 1
+    )
+    WHERE %s
+"""
+
+# Position of the status field in Case, mapped from status_id on read
+_STATUS_INDEX = _CASE_COLUMNS.split(",").index("status")
+
+# Statements are kept as constants so the connection's statement cache
+# (see cached_statements in _open) reuses their compiled form across calls
+_SQL_GET_BY_NAME = _CASE_WITH_TX_SQL % "c.name = ? COLLATE NOCASE"
+_SQL_GET_BY_ID = _CASE_WITH_TX_SQL % "c.customer_id = ?"
+# A NULL status id leaves the status alone so the row can be checked before a new one is added
+_SQL_UPDATE_STATUS = """
+    UPDATE cases
+    SET status_id = COALESCE(?, status_id), updated_at = CURRENT_TIMESTAMP
+    WHERE customer_id = ?
+    RETURNING customer_id
+"""
+_SQL_SET_STATUS_ID = "UPDATE cases SET status_id = ? WHERE customer_id = ?"
+# Note timestamps are formatted by SQLite in local time, as the old Python-side notes were
+_SQL_INSERT_NOTE = """
+    INSERT INTO case_notes (case_id, ts, note)
+    VALUES (?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'), ?)
+"""
+_SQL_LOAD_STATUSES = "SELECT id, name FROM statuses"
+# The no-op DO UPDATE makes RETURNING yield the id for existing names too
+_SQL_ADD_STATUS = """
+    INSERT INTO statuses (name) VALUES (?)
+    ON CONFLICT (name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+_SQL_GET_NOTES = "SELECT notes FROM cases WHERE customer_id = ?"
+_SQL_GET_NOTE_HISTORY = """
+    SELECT ts, note FROM case_notes
+    WHERE case_id = ?
+    ORDER BY rowid
+"""
+_SQL_INSERT_CASE = """
+    INSERT INTO cases (customer_id, name, card_last4, security_question, security_answer)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_TX = """
+    INSERT INTO transactions (customer_id, merchant, amount, location, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_LIST_CASES = """
+    SELECT c.customer_id, c.name, c.card_last4, s.name, c.updated_at
+    FROM cases c
+    LEFT JOIN statuses s ON s.id = c.status_id
+    ORDER BY c.updated_at DESC, c.customer_id
+    LIMIT ?
+"""
+# Keyset page after (updated_at, customer_id); the first term bounds the index
+# range, the second skips rows already returned among updated_at ties
+_SQL_LIST_CASES_AFTER = """
+    SELECT c.customer_id, c.name, c.card_last4, s.name, c.updated_at
+    FROM cases c
+    LEFT JOIN statuses s ON s.id = c.status_id
+    WHERE c.updated_at <= ? AND (c.updated_at < ? OR c.customer_id > ?)
+    ORDER BY c.updated_at DESC, c.customer_id
+    LIMIT ?
+"""
+
+# NOCASE only folds ASCII letters, so cache keys for names must fold the same way;
+# str.lower() would also merge non-ASCII names that SQLite treats as distinct
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def _name_key(name: str) -> str:
+    """Fold a customer name the way the NOCASE collation compares it."""
+    return name.translate(_ASCII_LOWER)
+
+Transaction = namedtuple("Transaction", _TX_COLUMNS)
+
+# One row of list_all_cases
+CaseSummary = namedtuple("CaseSummary", ["customer_id", "name", "card_last4", "status", "updated_at"])
+
+class Case(namedtuple("Case", _CASE_COLUMNS.split(",") + ["transaction"])):
+    """A fraud case with its latest Transaction (None if it has none)."""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for JSON serialization."""
+        case = self._asdict()
+        case['transaction'] = self.transaction._asdict() if self.transaction else {}
+        return case
+
+def _close_at_exit(ref: "weakref.ref[FraudDatabase]"):
+    """Close a database at interpreter exit if it is still alive."""
+    db = ref()
+    if db is not None:
+        db.close()
+
 class FraudDatabase:
     def __init__(self, db_path: str = "fraud_db.sqlite"):
-        """Initialize SQLite database connection and create tables if needed."""
+        """Initialize SQLite database connection and create tables if needed.
+        
+        db_path may also be ":memory:" or a "file:" URI such as
+        "file::memory:?cache=shared" or "file:fraud?mode=memory&cache=shared". An in-memory database is served by a
+        single connection that threads take turns on, so every thread of this
+        instance sees the same data. Separate instances opening the same shared-cache
+        name share the data too, but get "database table is locked" errors instead
+        of waiting when they write concurrently.
+        """
         self.db_path = db_path
+        self._uri = db_path.startswith("file:")
+        self._in_memory = (db_path == ":memory:" or db_path.startswith("file::memory:")
+                           or "mode=memory" in db_path)
+        self._local = threading.local()
+        
+        # Every connection opened, so close() can shut them all down
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+        
+        # In-memory databases use one shared connection, which also keeps the
+        # database alive; file databases use one connection per thread
+        self._memory_conn = self._open() if self._in_memory else None
+        self._memory_lock = threading.RLock() if self._in_memory else nullcontext()
+        
+        # Read-through LRU of cases keyed by customer_id, plus name -> id lookups.
+        # Only writes made through this instance invalidate it.
+        self._case_cache: "OrderedDict[str, Case]" = OrderedDict()
+        self._name_to_id: Dict[str, str] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped on every invalidation so a read that raced a write doesn't cache
+        # the row it fetched before the write committed
+        self._cache_generation = 0
+        
+        # status name <-> id, loaded from the statuses table
+        self._status_ids: Dict[str, int] = {}
+        self._status_names: Dict[int, str] = {}
+        
         self._init_database()
+        
+        atexit.register(_close_at_exit, weakref.ref(self))
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Return the connection for this thread, opening it on first use."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("FraudDatabase is closed")
+        if self._memory_conn is not None:
+            return self._memory_conn
+        
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor, holding the shared connection's lock for in-memory databases."""
+        with self._memory_lock:
+            yield self._conn().cursor()
+    
+    def _open(self) -> sqlite3.Connection:
+        """Open a long-lived autocommit connection with the tuning PRAGMAs applied."""
+        conn = sqlite3.connect(
+            self.db_path,
+            uri=self._uri,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """Refresh planner statistics and close every connection.
+        
+        The instance can't be used afterwards; an in-memory database is dropped.
+        """
+        with self._memory_lock, self._connections_lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        
+        for conn in connections:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
+            conn.close()
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block inside BEGIN IMMEDIATE/COMMIT, rolling back if anything fails."""
+        with self._memory_lock:
+            conn = self._conn()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
     
     def _init_database(self):
         """Create tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Cases table
+            # Larger pages keep a case row and its neighbours together; page_size only
+            # takes effect on a database with no content yet, and before WAL is enabled
+            conn = self._conn()
+            if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+                conn.execute("PRAGMA page_size=8192")
+                conn.execute("VACUUM")
+            
+            # WAL lets readers proceed during writes and halves fsyncs per commit;
+            # in-memory databases have no journal file to switch
+            if not self._in_memory:
+                conn.execute("PRAGMA journal_mode=WAL")
+            
+            with self._transaction() as cursor:
+                # Status lookup table
                 cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS cases (
-                        customer_id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        card_last4 TEXT NOT NULL,
-                        security_question TEXT NOT NULL,
-                        security_answer TEXT NOT NULL,
-                        status TEXT DEFAULT 'pending',
-                        notes TEXT DEFAULT '',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    CREATE TABLE IF NOT EXISTS statuses (
+                        id INTEGER PRIMARY KEY,
+                        name TEXT UNIQUE NOT NULL
                     )
                 """)
+                cursor.executemany("INSERT OR IGNORE INTO statuses (id, name) VALUES (?, ?)",
+                                   _STATUS_NAMES.items())
+                
+                # Cases table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS cases (%s)
+                """ % _CASES_DDL_COLUMNS)
                 
                 # Transactions table
                 cursor.execute("""
@@ -46,135 +302,267 @@ class FraudDatabase:
                     )
                 """)
                 
-                conn.commit()
-                logger.info(f"Database initialized at {self.db_path}")
+                # Append-only notes added on each status change; cases.notes keeps
+                # the original case note
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS case_notes (
+                        case_id TEXT NOT NULL,
+                        ts TIMESTAMP NOT NULL,
+                        note TEXT NOT NULL,
+                        FOREIGN KEY (case_id) REFERENCES cases (customer_id)
+                    )
+                """)
+                
+                self._migrate_cases_table(cursor)
+                
+                # Indexes for name lookups and latest-transaction lookups
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_cases_name_nocase
+                    ON cases (name COLLATE NOCASE)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_tx_customer
+                    ON transactions (customer_id, id DESC)
+                """)
+                # Covering index so list_all_cases is an ordered index scan with no sort
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_cases_updated
+                    ON cases (updated_at DESC, customer_id, name, card_last4, status_id)
+                """)
+                # Notes are read in insertion (rowid) order, which the index on
+                # case_id alone yields without a sort; replaces the old (case_id, ts) index
+                cursor.execute("DROP INDEX IF EXISTS idx_case_notes_case")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_case_notes_case_id
+                    ON case_notes (case_id)
+                """)
+            
+            # Collect planner statistics once there are cases to measure; skipping
+            # empty tables avoids recording stats that claim they're empty. Later
+            # inits and close() run PRAGMA optimize, which before SQLite 3.46 only
+            # refreshes stats for tables the connection has queried
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+            if has_stats is None and conn.execute("SELECT 1 FROM cases LIMIT 1").fetchone():
+                conn.execute("ANALYZE")
+            else:
+                conn.execute("PRAGMA optimize")
+            
+            self._load_statuses()
+            logger.info(f"Database initialized at {self.db_path}")
         except Exception as e:
             logger.error(f"Database initialization error: {e}")
             raise
     
-    def get_case_by_name(self, name: str) -> Optional[Dict]:
+    def _migrate_cases_table(self, cursor: sqlite3.Cursor):
+        """Rebuild the cases table once if it predates COLLATE NOCASE names or status ids.
+        
+        Both older layouts store the status as text, which is mapped onto statuses.
+        """
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'cases'")
+        row = cursor.fetchone()
+        if not row or "status_id" in row[0]:
+            return
+        
+        logger.info("Migrating cases table to NOCASE names and integer status ids")
+        cursor.execute("""
+            INSERT OR IGNORE INTO statuses (name)
+            SELECT DISTINCT status FROM cases WHERE status IS NOT NULL
+        """)
+        cursor.execute("""
+            CREATE TABLE cases_new (%s)
+        """ % _CASES_DDL_COLUMNS)
+        cursor.execute("""
+            INSERT INTO cases_new (customer_id, name, card_last4, security_question,
+                                   security_answer, status_id, notes, created_at, updated_at)
+            SELECT customer_id, name, card_last4, security_question, security_answer,
+                   COALESCE((SELECT id FROM statuses WHERE statuses.name = cases.status), 0),
+                   notes, created_at, updated_at
+            FROM cases
+        """)
+        cursor.execute("DROP TABLE cases")
+        cursor.execute("ALTER TABLE cases_new RENAME TO cases")
+    
+    def _load_statuses(self):
+        """(Re)load the status name <-> id mapping from the statuses table."""
+        with self._cursor() as cursor:
+            rows = cursor.execute(_SQL_LOAD_STATUSES).fetchall()
+        self._status_names = dict(rows)
+        self._status_ids = {name: status_id for status_id, name in rows}
+    
+    def _status_name(self, status_id: int) -> Optional[str]:
+        """Map a status id to its name, reloading once for ids added elsewhere."""
+        name = self._status_names.get(status_id)
+        if name is None:
+            self._load_statuses()
+            name = self._status_names.get(status_id)
+        return name
+    
+    def _row_to_case(self, row: Tuple) -> Case:
+        """Split a joined case row into a Case and its Transaction."""
+        split = len(row) - len(_TX_COLUMNS)
+        transaction = Transaction(*row[split:]) if row[split] is not None else None
+        fields = list(row[:split])
+        fields[_STATUS_INDEX] = self._status_name(fields[_STATUS_INDEX])
+        return Case(*fields, transaction)
+    
+    def _cache_get(self, customer_id: str) -> Optional[Case]:
+        """Return a cached case, marking it most recently used."""
+        with self._cache_lock:
+            case = self._case_cache.get(customer_id)
+            if case is not None:
+                self._case_cache.move_to_end(customer_id)
+            return case
+    
+    def _cache_put(self, case: Case, generation: int, name: Optional[str] = None):
+        """Cache a case read at `generation`, evicting the least recently used entry when full.
+        
+        Skipped if anything was invalidated since, as the row may predate that write.
+        """
+        customer_id = case.customer_id
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            
+            self._case_cache[customer_id] = case
+            self._case_cache.move_to_end(customer_id)
+            if name is not None:
+                self._name_to_id[_name_key(name)] = customer_id
+            
+            if len(self._case_cache) > _CACHE_MAX:
+                evicted_id, _ = self._case_cache.popitem(last=False)
+                self._drop_names(evicted_id)
+    
+    def _cache_invalidate(self, customer_id: str, name: Optional[str] = None):
+        """Drop a case and any name lookups that point at it."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._case_cache.pop(customer_id, None)
+            self._drop_names(customer_id)
+            if name is not None:
+                self._name_to_id.pop(_name_key(name), None)
+    
+    def _drop_names(self, customer_id: str):
+        """Remove name lookups for a customer; caller holds the cache lock."""
+        stale = [key for key, value in self._name_to_id.items() if value == customer_id]
+        for key in stale:
+            del self._name_to_id[key]
+    
+    def get_case_by_name(self, name: str) -> Optional[Case]:
         """Retrieve a case by customer name."""
+        customer_id = self._name_to_id.get(_name_key(name))
+        if customer_id is not None:
+            cached = self._cache_get(customer_id)
+            if cached is not None:
+                return cached
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                # Get case details
-                cursor.execute("""
-                    SELECT * FROM cases WHERE LOWER(name) = LOWER(?)
-                """, (name,))
-                
+            with self._cursor() as cursor:
+                # Get case details with its latest transaction
+                generation = self._cache_generation
+                cursor.execute(_SQL_GET_BY_NAME, (name,))
                 case_row = cursor.fetchone()
+                
                 if not case_row:
                     return None
                 
-                case = dict(case_row)
-                
-                # Get associated transaction
-                cursor.execute("""
-                    SELECT merchant, amount, location, timestamp 
-                    FROM transactions 
-                    WHERE customer_id = ?
-                    ORDER BY id DESC LIMIT 1
-                """, (case['customer_id'],))
-                
-                tx_row = cursor.fetchone()
-                if tx_row:
-                    case['transaction'] = dict(tx_row)
-                else:
-                    case['transaction'] = {}
-                
+                case = self._row_to_case(case_row)
+                self._cache_put(case, generation, name)
                 return case
         except Exception as e:
             logger.error(f"Error fetching case by name '{name}': {e}")
             return None
     
-    def get_case_by_id(self, customer_id: str) -> Optional[Dict]:
+    def get_case_by_id(self, customer_id: str) -> Optional[Case]:
         """Retrieve a case by customer ID."""
+        cached = self._cache_get(customer_id)
+        if cached is not None:
+            return cached
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("SELECT * FROM cases WHERE customer_id = ?", (customer_id,))
+            with self._cursor() as cursor:
+                generation = self._cache_generation
+                cursor.execute(_SQL_GET_BY_ID, (customer_id,))
                 case_row = cursor.fetchone()
                 
                 if not case_row:
                     return None
                 
-                case = dict(case_row)
-                
-                # Get transaction
-                cursor.execute("""
-                    SELECT merchant, amount, location, timestamp 
-                    FROM transactions 
-                    WHERE customer_id = ?
-                    ORDER BY id DESC LIMIT 1
-                """, (customer_id,))
-                
-                tx_row = cursor.fetchone()
-                case['transaction'] = dict(tx_row) if tx_row else {}
-                
+                case = self._row_to_case(case_row)
+                self._cache_put(case, generation)
                 return case
         except Exception as e:
             logger.error(f"Error fetching case by ID '{customer_id}': {e}")
             return None
     
-    def update_case_status(self, customer_id: str, status: str, note: str) -> bool:
-        """Update case status and append notes."""
+    def get_case_notes(self, customer_id: str) -> Optional[str]:
+        """Get a case's notes: the original note followed by each status-change note."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get existing notes
-                cursor.execute("SELECT notes FROM cases WHERE customer_id = ?", (customer_id,))
+            with self._cursor() as cursor:
+                cursor.execute(_SQL_GET_NOTES, (customer_id,))
                 row = cursor.fetchone()
                 
                 if not row:
+                    return None
+                
+                cursor.execute(_SQL_GET_NOTE_HISTORY, (customer_id,))
+                entries = [f"[{ts}] {note}" for ts, note in cursor.fetchall()]
+                return " | ".join([row[0] or ""] + entries).strip()
+        except Exception as e:
+            logger.error(f"Error fetching notes for '{customer_id}': {e}")
+            return None
+    
+    def update_case_status(self, customer_id: str, status: str, note: str) -> bool:
+        """Update case status and append a note to its history."""
+        try:
+            status_id = self._status_ids.get(status)
+            
+            with self._transaction() as cursor:
+                # RETURNING doubles as the existence check
+                cursor.execute(_SQL_UPDATE_STATUS, (status_id, customer_id))
+                
+                if cursor.fetchone() is None:
                     logger.warning(f"Customer ID {customer_id} not found")
                     return False
                 
-                existing_notes = row[0] or ""
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                new_notes = f"{existing_notes} | [{timestamp}] {note}".strip()
+                if status_id is None:
+                    # Register a new status only for an existing case, so a failed
+                    # update rolls it back along with everything else
+                    new_id = cursor.execute(_SQL_ADD_STATUS, (status,)).fetchone()[0]
+                    cursor.execute(_SQL_SET_STATUS_ID, (new_id, customer_id))
                 
-                # Update status and notes
-                cursor.execute("""
-                    UPDATE cases 
-                    SET status = ?, notes = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE customer_id = ?
-                """, (status, new_notes, customer_id))
-                
-                conn.commit()
-                logger.info(f"Updated case {customer_id}: status={status}")
-                return True
+                cursor.execute(_SQL_INSERT_NOTE, (customer_id, note))
+            
+            if status_id is None:
+                self._load_statuses()
+            self._cache_invalidate(customer_id)
+            logger.info(f"Updated case {customer_id}: status={status}")
+            return True
         except Exception as e:
             logger.error(f"Error updating case status: {e}")
             return False
     
-    def add_case(self, customer_id: str, name: str, card_last4: str, 
+    def _insert_cases(self, rows: List[Tuple]):
+        """Insert cases and their transactions in one transaction; raises on failure."""
+        with self._transaction() as cursor:
+            # Insert cases
+            cursor.executemany(_SQL_INSERT_CASE, [row[:5] for row in rows])
+            
+            # Insert transactions
+            cursor.executemany(_SQL_INSERT_TX, [(row[0],) + tuple(row[5:]) for row in rows])
+        
+        for row in rows:
+            self._cache_invalidate(row[0], row[1])
+    
+    def add_case(self, customer_id: str, name: str, card_last4: str,
                  security_question: str, security_answer: str,
                  merchant: str, amount: str, location: str, timestamp: str) -> bool:
         """Add a new fraud case with transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insert case
-                cursor.execute("""
-                    INSERT INTO cases (customer_id, name, card_last4, security_question, security_answer)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (customer_id, name, card_last4, security_question, security_answer))
-                
-                # Insert transaction
-                cursor.execute("""
-                    INSERT INTO transactions (customer_id, merchant, amount, location, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (customer_id, merchant, amount, location, timestamp))
-                
-                conn.commit()
-                logger.info(f"Added new case: {customer_id}")
-                return True
+            self._insert_cases([(customer_id, name, card_last4, security_question, security_answer,
+                                 merchant, amount, location, timestamp)])
+            logger.info(f"Added new case: {customer_id}")
+            return True
         except sqlite3.IntegrityError:
             logger.warning(f"Case {customer_id} already exists")
             return False
@@ -182,20 +570,47 @@ class FraudDatabase:
             logger.error(f"Error adding case: {e}")
             return False
     
-    def list_all_cases(self) -> List[Dict]:
-        """Get all cases with their basic info."""
+    def add_cases_bulk(self, rows: List[Tuple]) -> bool:
+        """Add many fraud cases in a single transaction.
+        
+        Each row is (customer_id, name, card_last4, security_question, security_answer,
+        merchant, amount, location, timestamp). Nothing is inserted if any row fails.
+        """
+        try:
+            self._insert_cases(rows)
+            logger.info(f"Added {len(rows)} new cases")
+            return True
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"Bulk case insert rejected: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error adding cases in bulk: {e}")
+            return False
+    
+    def list_all_cases(self, limit: int = 50,
+                       after: Optional[Tuple[str, str]] = None) -> Tuple[List[CaseSummary], Optional[Tuple[str, str]]]:
+        """Get one page of cases with their basic info, most recently updated first.
+        
+        Returns the page and a cursor to pass as `after` for the next page, or None
+        when there are no more cases. Raises ValueError if limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
+            with self._cursor() as cursor:
+                if after is None:
+                    cursor.execute(_SQL_LIST_CASES, (limit,))
+                else:
+                    updated_at, customer_id = after
+                    cursor.execute(_SQL_LIST_CASES_AFTER, (updated_at, updated_at, customer_id, limit))
                 
-                cursor.execute("""
-                    SELECT customer_id, name, card_last4, status, updated_at 
-                    FROM cases 
-                    ORDER BY updated_at DESC
-                """)
+                cases = list(map(CaseSummary._make, cursor.fetchall()))
+                if len(cases) < limit:
+                    return cases, None
                 
-                return [dict(row) for row in cursor.fetchall()]
+                last = cases[-1]
+                return cases, (last.updated_at, last.customer_id)
         except Exception as e:
             logger.error(f"Error listing cases: {e}")
-            return []
\ No newline at end of file
+            return [], None
\ No newline at end of file
@@ -0,0 +1,236 @@
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from db import FraudDatabase
+
+
+def _row(customer_id: str, name: str) -> tuple:
+    return (customer_id, name, "1234", "Favourite colour?", "Blue",
+            "Acme Store", "₹1,000", "Mumbai", "2025-11-24 10:00:00")
+
+
+@pytest.fixture
+def db():
+    database = FraudDatabase(":memory:")
+    yield database
+    database.close()
+
+
+def test_add_and_get_case(db: FraudDatabase) -> None:
+    """Cases round-trip with their latest transaction and case-insensitive names."""
+    assert db.add_case(*_row("C1", "Amit Sharma"))
+
+    case = db.get_case_by_name("AMIT SHARMA")
+    assert case.customer_id == "C1"
+    assert case.status == "pending"
+    assert case.transaction.merchant == "Acme Store"
+    assert case.to_dict()["transaction"]["location"] == "Mumbai"
+
+    assert db.get_case_by_id("missing") is None
+    assert db.get_case_by_name("nobody") is None
+
+
+def test_duplicate_case_is_rejected(db: FraudDatabase) -> None:
+    """Adding an existing customer ID fails without raising."""
+    assert db.add_case(*_row("C1", "Amit Sharma"))
+    assert not db.add_case(*_row("C1", "Amit Sharma"))
+
+
+def test_bulk_insert_rolls_back_on_duplicate(db: FraudDatabase) -> None:
+    """A failing row leaves none of the batch behind."""
+    assert db.add_case(*_row("C1", "Amit Sharma"))
+
+    assert not db.add_cases_bulk([_row("C2", "Priya Singh"), _row("C1", "Amit Sharma")])
+
+    assert db.get_case_by_id("C2") is None
+    page, _ = db.list_all_cases()
+    assert [case.customer_id for case in page] == ["C1"]
+
+
+def test_cache_is_invalidated_by_updates(db: FraudDatabase) -> None:
+    """Cached lookups reflect status changes made through the instance."""
+    db.add_case(*_row("C1", "Amit Sharma"))
+
+    first = db.get_case_by_id("C1")
+    assert db.get_case_by_id("C1") is first
+    by_name = db.get_case_by_name("amit sharma")
+    assert db.get_case_by_name("AMIT SHARMA") is by_name
+
+    assert db.update_case_status("C1", "resolved", "Card blocked")
+
+    assert db.get_case_by_id("C1").status == "resolved"
+    assert db.get_case_by_name("Amit Sharma").status == "resolved"
+
+
+def test_cache_skips_rows_read_before_a_write(db: FraudDatabase, monkeypatch) -> None:
+    """A row read before an update commits is returned but never cached."""
+    db.add_case(*_row("C1", "Amit Sharma"))
+    row_to_case = db._row_to_case
+
+    def update_mid_read(row):
+        monkeypatch.setattr(db, "_row_to_case", row_to_case)
+        db.update_case_status("C1", "resolved", "Card blocked")
+        return row_to_case(row)
+
+    monkeypatch.setattr(db, "_row_to_case", update_mid_read)
+
+    assert db.get_case_by_id("C1").status == "pending"
+    assert db.get_case_by_id("C1").status == "resolved"
+
+
+def test_update_unknown_case(db: FraudDatabase) -> None:
+    """Updating a missing customer reports failure."""
+    assert not db.update_case_status("missing", "resolved", "note")
+
+
+def test_unknown_status_is_registered_only_for_existing_cases(db: FraudDatabase) -> None:
+    """A typo against a missing customer must not leave a new status behind."""
+    db.add_case(*_row("C1", "Amit Sharma"))
+
+    assert not db.update_case_status("NOPE", "typo", "note")
+    assert "typo" not in db._status_ids
+    with db._cursor() as cursor:
+        assert cursor.execute("SELECT 1 FROM statuses WHERE name = 'typo'").fetchone() is None
+
+    assert db.update_case_status("C1", "escalated", "Sent to bank")
+    assert db.get_case_by_id("C1").status == "escalated"
+    assert "escalated" in db._status_ids
+
+
+def test_case_notes_format(db: FraudDatabase) -> None:
+    """Notes list status-change entries in the order they were added."""
+    db.add_case(*_row("C1", "Amit Sharma"))
+    assert db.get_case_notes("C1") == ""
+
+    db.update_case_status("C1", "in_review", "Called customer")
+    db.update_case_status("C1", "resolved", "Card reissued")
+
+    entries = db.get_case_notes("C1").split(" | ")
+    assert len(entries) == 2
+    assert entries[0].startswith("| [")
+    assert entries[0].endswith("] Called customer")
+    assert entries[1].endswith("] Card reissued")
+    assert db.get_case_notes("missing") is None
+
+
+def test_keyset_pagination_visits_every_case_once(db: FraudDatabase) -> None:
+    """Pages cover all cases even when they share an updated_at timestamp."""
+    db.add_cases_bulk([_row(f"C{i:02d}", f"Customer {i}") for i in range(23)])
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = db.list_all_cases(limit=5, after=cursor)
+        seen.extend(case.customer_id for case in page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 23
+    assert len(set(seen)) == 23
+
+
+def test_list_all_cases_rejects_bad_limit(db: FraudDatabase) -> None:
+    """A non-positive page size is a caller error."""
+    with pytest.raises(ValueError):
+        db.list_all_cases(limit=0)
+
+
+@pytest.mark.parametrize("db_path", [":memory:", "file::memory:?cache=shared"])
+def test_memory_database_is_shared_across_threads(db_path: str) -> None:
+    """Threads of one in-memory instance see the same data and don't lock each other out."""
+    db = FraudDatabase(db_path)
+    db.add_cases_bulk([_row(f"C{i}", f"Customer {i}") for i in range(6)])
+    results = []
+
+    def worker(i: int) -> None:
+        for j in range(50):
+            results.append(db.update_case_status(f"C{i}", "in_review", f"note {j}"))
+            results.append(db.get_case_by_name(f"customer {i}") is not None)
+            results.append(db.get_case_notes(f"C{i}").endswith(f"] note {j}"))
+            results.append(len(db.list_all_cases(limit=2)[0]) == 2)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    db.close()
+
+    assert len(results) == 1200
+    assert all(results)
+
+
+def test_private_memory_uri_is_shared_across_threads() -> None:
+    """A private file::memory: URI still gives every thread the same database."""
+    db = FraudDatabase("file::memory:")
+    db.add_case(*_row("C1", "Amit Sharma"))
+    found = []
+
+    thread = threading.Thread(target=lambda: found.append(db.get_case_by_id("C1")))
+    thread.start()
+    thread.join()
+    db.close()
+
+    assert found[0] is not None
+
+
+def test_closed_database_fails_cleanly() -> None:
+    """After close(), calls fail through the usual error paths instead of reopening."""
+    database = FraudDatabase(":memory:")
+    database.add_case(*_row("C1", "Amit Sharma"))
+    database.close()
+
+    assert not database.add_case(*_row("C2", "Priya Singh"))
+    assert database.list_all_cases() == ([], None)
+
+
+def test_migrates_bundled_database(tmp_path: Path) -> None:
+    """The shipped fraud_db.sqlite upgrades in place without losing data."""
+    path = tmp_path / "fraud_db.sqlite"
+    shutil.copy(Path(__file__).parents[1] / "src" / "fraud_db.sqlite", path)
+
+    database = FraudDatabase(str(path))
+    try:
+        assert database.get_case_by_id("CUST-IND-0001").status == "pending"
+        assert database.get_case_by_id("CUST-IND-0002").status == "resolved"
+        assert database.get_case_by_id("CUST-IND-0003").status == "in_review"
+        assert database.get_case_by_name("amit sharma").customer_id == "CUST-IND-0001"
+        assert database.get_case_notes("CUST-IND-0001") == (
+            "Customer reported suspicious UPI transactions on 24 Nov 2025.")
+
+        assert database.update_case_status("CUST-IND-0001", "resolved", "Card blocked")
+        notes = database.get_case_notes("CUST-IND-0001")
+        assert notes.startswith("Customer reported suspicious UPI transactions")
+        assert notes.endswith("] Card blocked")
+    finally:
+        database.close()
+
+    conn = sqlite3.connect(path)
+    (schema,) = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'cases'").fetchone()
+    conn.close()
+    assert "status_id" in schema
+    assert "COLLATE NOCASE" in schema
+
+
+def test_statistics_are_collected_once_cases_exist(tmp_path: Path) -> None:
+    """Init skips ANALYZE on an empty database and runs it once cases are present."""
+    path = str(tmp_path / "stats.sqlite")
+
+    def has_stats() -> bool:
+        conn = sqlite3.connect(path)
+        found = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+        conn.close()
+        return found is not None
+
+    database = FraudDatabase(path)
+    assert not has_stats()
+    database.add_cases_bulk([_row(f"C{i}", f"Customer {i}") for i in range(50)])
+
+    FraudDatabase(path).close()
+    database.close()
+    assert has_stats()